@@ -8,6 +8,7 @@ import logging
 from typing import Dict, Any, List, Optional
 from core.llm_manager import LLMManager
 from utils.cache_utils import cache_result
+from utils.json_utils import loads as json_loads
 from config.settings import MOOD_OPTIONS, GENRE_OPTIONS
 
 logger = logging.getLogger(__name__)
@@ -220,7 +221,7 @@ PENTING: Kembalikan HANYA JSON tanpa markdown atau text tambahan!"""
             logger.debug(f"Cleaned JSON string: {json_str[:200]}...")
             
             # Step 5: Parse JSON
-            result = json.loads(json_str)
+            result = json_loads(json_str)
             logger.debug(f"JSON parsed successfully: {list(result.keys())}")
             
             # Validate required fields
@@ -274,7 +275,7 @@ PENTING: Kembalikan HANYA JSON tanpa markdown atau text tambahan!"""
                     if end_pos != -1:
                         json_str = potential_json[:end_pos]
                         logger.debug(f"Extracted JSON using aggressive method: {json_str[:200]}...")
-                        result = json.loads(json_str)
+                        result = json_loads(json_str)
                         logger.info("Successfully parsed JSON using aggressive extraction")
                         return result
             except Exception as e2:
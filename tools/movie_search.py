@@ -96,7 +96,7 @@ class MovieSearcher:
             
             # Convert genre names to IDs
             logger.debug(f"Converting genre names to IDs: {genre_names}")
-            genre_ids = genre_names_to_ids(tuple(genre_names))
+            genre_ids = genre_names_to_ids(genre_names)
             logger.debug(f"Converted to genre IDs: {genre_ids}")
             
             if not genre_ids:
@@ -300,7 +300,7 @@ class MovieSearcher:
             
             if personalize:
                 movie_genre_ids = movie.get('genre_ids', [])
-                movie_genres = set(genre_ids_to_names(tuple(movie_genre_ids)))
+                movie_genres = set(genre_ids_to_names(movie_genre_ids))
                 
                 # Get user preferences
                 preferred = set(st.session_state.get('preferred_genres', []))
@@ -337,7 +337,7 @@ class MovieSearcher:
                 'rating': rating,
                 'popularity': popularity,
                 'vote_count': vote_count,
-                'genres': genre_ids_to_names(tuple(movie.get('genre_ids', []))),
+                'genres': genre_ids_to_names(movie.get('genre_ids', [])),
                 'overview': movie.get('overview', 'No description available'),
                 'score': round(final_score, 2),
                 'raw_payload': raw_payload  # Original Qdrant payload - REQUIRED for validation
@@ -401,7 +401,7 @@ class MovieSearcher:
                 'rating': movie.get('vote_average', 0),
                 'popularity': movie.get('popularity', 0),
                 'vote_count': movie.get('vote_count', 0),
-                'genres': genre_ids_to_names(tuple(movie.get('genre_ids', []))),
+                'genres': genre_ids_to_names(movie.get('genre_ids', [])),
                 'overview': movie.get('overview', 'No description available'),
                 'raw_payload': movie  # Original Qdrant payload - REQUIRED for validation
             }
@@ -447,7 +447,7 @@ class MovieSearcher:
                 'rating': movie.get('vote_average', 0),
                 'popularity': movie.get('popularity', 0),
                 'vote_count': movie.get('vote_count', 0),
-                'genres': genre_ids_to_names(tuple(movie.get('genre_ids', []))),
+                'genres': genre_ids_to_names(movie.get('genre_ids', [])),
                 'overview': movie.get('overview', 'No description available'),
                 'raw_payload': movie
             }
@@ -3,14 +3,40 @@ Review Summarization Tool
 File: tools/review_summarizer.py
 """
 
+import hashlib
 import logging
 import re
+import time
 from typing import Any, List
 from core.llm_manager import LLMManager
 from utils.cache_utils import StreamlitCache
+from utils.json_utils import loads as json_loads
 
 logger = logging.getLogger(__name__)
 
+# Reasoning/thinking blocks some models emit before the answer
+_REASONING_RE = re.compile(r'<(think|reasoning|thought)>.*?</\1>', re.DOTALL | re.IGNORECASE)
+
+# Words that mark leftover model reasoning at the start of a summary
+_REASONING_KEYWORDS = frozenset(['okay', 'let', 'tackle', 'user', 'wants', 'reviews', 'combine'])
+
+# Fallback review delimiters for plain-text reviews
+_DELIM_RE = re.compile(r'[;\n|]')
+
+# Total characters of review text sent to the LLM per summary
+MAX_PROMPT_REVIEW_CHARS = 600
+
+SUMMARY_PROMPT_TEMPLATE = """Jadikan semua ulasan ini jadi SATU KALIMAT gaul ala netizen Indonesia (maksimal 25 kata):
+
+{reviews}
+
+Contoh style yang diinginkan:
+- "Katanya masterpiece banget, bikin nangis bombay!"
+- "Netizen bilang best movie ever, acting on point!"
+- "Ceritanya mind-blowing, wajib nonton berkali-kali!"
+
+PENTING: Tulis HANYA satu kalimat tanpa kutip atau markdown!"""
+
 class ReviewSummarizer:
     """Summarize movie reviews into catchy one-liners"""
     
@@ -33,15 +59,14 @@ class ReviewSummarizer:
         Returns:
             Catchy one-sentence summary
         """
-        import time
         start_time = time.time()
         
-        logger.debug(f"Summarizing reviews - Type: {type(raw_reviews).__name__}")
+        logger.debug("Summarizing reviews - Type: %s", type(raw_reviews).__name__)
         
         try:
             # Check cache first
-            cache_key = str(raw_reviews)[:100] if raw_reviews else "empty"
-            logger.debug(f"Checking cache with key: {cache_key[:50]}...")
+            cache_key = self._get_cache_key(raw_reviews)
+            logger.debug("Checking cache with key: %.50s...", cache_key)
             cached = StreamlitCache.get("review_summary", cache_key)
             if cached:
                 duration = time.time() - start_time
@@ -51,7 +76,7 @@ class ReviewSummarizer:
             # Normalize reviews to list of strings
             logger.debug("Normalizing reviews...")
             reviews = self._normalize_reviews(raw_reviews)
-            logger.debug(f"Normalized to {len(reviews)} review(s)")
+            logger.debug("Normalized to %d review(s)", len(reviews))
             
             if not reviews:
                 logger.warning("No reviews to summarize")
@@ -60,7 +85,7 @@ class ReviewSummarizer:
             # Generate summary using LLM
             logger.debug("Generating summary using LLM...")
             summary = self._generate_summary(reviews)
-            logger.debug(f"Generated summary: {summary[:100]}...")
+            logger.debug("Generated summary: %.100s...", summary)
             
             # Cache result
             StreamlitCache.set("review_summary", summary, 7200, cache_key)  # 2 hours TTL
@@ -76,6 +101,29 @@ class ReviewSummarizer:
             logger.warning("Returning fallback summary")
             return "Netizen bilang filmnya bagus!"
     
+    @staticmethod
+    def _get_cache_key(raw_reviews: Any) -> str:
+        """
+        Build a content hash for raw reviews without stringifying the whole blob
+        
+        Args:
+            raw_reviews: Reviews in any format
+        
+        Returns:
+            Hex digest usable as cache key
+        """
+        if not raw_reviews:
+            return "empty"
+        
+        h = hashlib.blake2b(digest_size=16)
+        if isinstance(raw_reviews, list):
+            for r in raw_reviews:
+                h.update(str(r).encode())
+                h.update(b'\x00')
+        else:
+            h.update(str(raw_reviews)[:4096].encode())
+        return h.hexdigest()
+    
     def _normalize_reviews(self, raw_reviews: Any) -> List[str]:
         """
         Normalize reviews to list of strings
@@ -86,7 +134,7 @@ class ReviewSummarizer:
         Returns:
             List of review strings
         """
-        logger.debug(f"Normalizing reviews - Input type: {type(raw_reviews).__name__}")
+        logger.debug("Normalizing reviews - Input type: %s", type(raw_reviews).__name__)
         reviews = []
         
         # Handle None or empty
@@ -96,49 +144,54 @@ class ReviewSummarizer:
         
         # Handle list
         if isinstance(raw_reviews, list):
-            logger.debug(f"Processing list with {len(raw_reviews)} items")
+            logger.debug("Processing list with %d items", len(raw_reviews))
             for item in raw_reviews:
                 if item and str(item).strip():
                     reviews.append(str(item).strip())
-            logger.debug(f"Extracted {len(reviews)} reviews from list")
+            logger.debug("Extracted %d reviews from list", len(reviews))
         
         # Handle string
         elif isinstance(raw_reviews, str):
             text = raw_reviews.strip()
-            logger.debug(f"Processing string (length: {len(text)} chars)")
+            logger.debug("Processing string (length: %d chars)", len(text))
             
             # Check if empty or null
             if not text or text.lower() == "null":
                 logger.debug("String is empty or 'null'")
                 return []
             
-            # Try to parse as JSON
-            try:
-                import json
-                parsed = json.loads(text)
-                logger.debug("Successfully parsed as JSON")
+            # Try to parse as JSON (only if it can be an array/object)
+            parsed = None
+            if text[0] in "[{":
+                try:
+                    parsed = json_loads(text)
+                    logger.debug("Successfully parsed as JSON")
+                except ValueError:
+                    logger.debug("Looks like JSON but failed to parse")
+
+            if parsed is not None:
                 if isinstance(parsed, list):
                     reviews = [str(x).strip() for x in parsed if str(x).strip()]
-                    logger.debug(f"Extracted {len(reviews)} reviews from JSON list")
+                    logger.debug("Extracted %d reviews from JSON list", len(reviews))
                 else:
                     reviews = [text]
                     logger.debug("JSON is not a list, using as single review")
-            except:
+            else:
                 logger.debug("Not valid JSON, trying delimiter splitting")
                 # Split by common delimiters
                 if "|||" in text:
                     reviews = [r.strip() for r in text.split("|||") if r.strip()]
-                    logger.debug(f"Split by ||| - {len(reviews)} reviews")
-                elif any(sep in text for sep in ["\n", ";", "|"]):
-                    reviews = [r.strip() for r in re.split(r'[;\n|]', text) if r.strip()]
-                    logger.debug(f"Split by delimiters - {len(reviews)} reviews")
+                    logger.debug("Split by ||| - %d reviews", len(reviews))
+                elif _DELIM_RE.search(text):
+                    reviews = [r.strip() for r in _DELIM_RE.split(text) if r.strip()]
+                    logger.debug("Split by delimiters - %d reviews", len(reviews))
                 else:
                     reviews = [text] if len(text) > 10 else []
-                    logger.debug(f"Using as single review: {len(reviews)}")
+                    logger.debug("Using as single review: %d", len(reviews))
         
         # Limit to first 6 reviews
         result = reviews[:6]
-        logger.debug(f"Final normalized reviews count: {len(result)} (limited from {len(reviews)})")
+        logger.debug("Final normalized reviews count: %d (limited from %d)", len(result), len(reviews))
         return result
     
     def _generate_summary(self, reviews: List[str]) -> str:
@@ -151,47 +204,52 @@ class ReviewSummarizer:
         Returns:
             One-sentence summary
         """
-        import time
         start_time = time.time()
         
-        logger.debug(f"Generating summary from {len(reviews)} reviews")
+        logger.debug("Generating summary from %d reviews", len(reviews))
+        
+        # A single (or repeated) short review is already a summary, skip the LLM
+        # (same 10-200 char bounds as a generated summary; shorter ones fall through)
+        if len(set(reviews)) == 1:
+            single = reviews[0].strip().strip('"\'')
+            if 10 < len(single) <= 200:
+                logger.debug("Single distinct short review, skipping LLM")
+                return single
         
         try:
-            # Prepare reviews for prompt (truncate long ones)
-            review_snippets = [
-                r[:150] + "..." if len(r) > 150 else r 
-                for r in reviews
-            ]
-            logger.debug(f"Prepared {len(review_snippets)} review snippets for prompt")
+            # Prepare reviews for prompt (dedupe, then fill a global char budget)
+            review_snippets = []
+            seen = set()
+            budget = MAX_PROMPT_REVIEW_CHARS
+            for r in reviews:
+                key = r[:80].lower()
+                if key in seen:
+                    continue
+                seen.add(key)
+                if len(r) > budget:
+                    review_snippets.append(r[:budget] + "...")
+                    break
+                review_snippets.append(r)
+                budget -= len(r)
+                if budget <= 0:
+                    break
+            logger.debug("Prepared %d review snippets for prompt", len(review_snippets))
             
-            prompt = f"""Jadikan semua ulasan ini jadi SATU KALIMAT gaul ala netizen Indonesia (maksimal 25 kata):
+            prompt = SUMMARY_PROMPT_TEMPLATE.format_map({
+                "reviews": "\n".join(f"- {r}" for r in review_snippets)
+            })
 
-{chr(10).join([f"- {r}" for r in review_snippets])}
-
-Contoh style yang diinginkan:
-- "Katanya masterpiece banget, bikin nangis bombay!"
-- "Netizen bilang best movie ever, acting on point!"
-- "Ceritanya mind-blowing, wajib nonton berkali-kali!"
-
-PENTING: Tulis HANYA satu kalimat tanpa kutip atau markdown!"""
-
-            logger.debug(f"Invoking LLM with prompt (length: {len(prompt)} chars)")
+            logger.debug("Invoking LLM with prompt (length: %d chars)", len(prompt))
             response = self.llm_manager.invoke(prompt)
-            logger.debug(f"LLM response received (length: {len(response)} chars)")
+            logger.debug("LLM response received (length: %d chars)", len(response))
             
             # Clean response - extract only the actual summary text
             summary = response.strip()
             original_summary = summary
             
             # Remove reasoning/thinking tags if present
-            reasoning_patterns = [
-                r'<think>.*?</think>',
-                r'<reasoning>.*?</reasoning>',
-                r'<think>.*?</think>',
-                r'<thought>.*?</thought>',
-            ]
-            for pattern in reasoning_patterns:
-                summary = re.sub(pattern, '', summary, flags=re.DOTALL | re.IGNORECASE)
+            if '<' in summary:
+                summary = _REASONING_RE.sub('', summary)
             
             # Remove markdown code blocks
             summary = summary.replace("```", "").strip()
@@ -201,30 +259,29 @@ PENTING: Tulis HANYA satu kalimat tanpa kutip atau markdown!"""
             
             # If response is too long, try to extract just the first sentence or first 150 chars
             if len(summary) > 200:
-                logger.debug(f"Summary too long ({len(summary)} chars), extracting first sentence...")
+                logger.debug("Summary too long (%d chars), extracting first sentence...", len(summary))
                 # Try to find first sentence (ending with . ! or ?)
                 sentence_match = re.search(r'^[^.!?]+[.!?]', summary)
                 if sentence_match:
                     summary = sentence_match.group(0).strip()
-                    logger.debug(f"Extracted first sentence: {summary[:100]}...")
+                    logger.debug("Extracted first sentence: %.100s...", summary)
                 else:
                     # If no sentence ending found, try to find first line break or take first 150 chars
                     first_line = summary.split('\n')[0].strip()
                     if len(first_line) > 0 and len(first_line) <= 200:
                         summary = first_line
-                        logger.debug(f"Took first line: {summary[:100]}...")
+                        logger.debug("Took first line: %.100s...", summary)
                     else:
                         # If still too long, take first 150 chars
                         summary = summary[:150].strip()
-                        logger.debug(f"Took first 150 chars: {summary[:100]}...")
+                        logger.debug("Took first 150 chars: %.100s...", summary)
             
             if summary != original_summary:
-                logger.debug(f"Cleaned summary (removed quotes/markdown/reasoning)")
+                logger.debug("Cleaned summary (removed quotes/markdown/reasoning)")
             
             # Final cleanup: remove any remaining reasoning keywords at the start
-            reasoning_keywords = ['okay', 'let', 'tackle', 'user', 'wants', 'reviews', 'combine']
             first_words = summary.lower().split()[:3]
-            if any(keyword in first_words for keyword in reasoning_keywords):
+            if not _REASONING_KEYWORDS.isdisjoint(first_words):
                 # Try to find actual summary after reasoning text
                 # Look for sentence that doesn't start with reasoning keywords
                 sentences = re.split(r'[.!?]+', summary)
@@ -232,15 +289,15 @@ PENTING: Tulis HANYA satu kalimat tanpa kutip atau markdown!"""
                     sentence = sentence.strip()
                     if sentence and len(sentence) > 20:
                         first_words_sent = sentence.lower().split()[:3]
-                        if not any(keyword in first_words_sent for keyword in reasoning_keywords):
+                        if _REASONING_KEYWORDS.isdisjoint(first_words_sent):
                             summary = sentence
-                            logger.debug(f"Extracted actual summary after reasoning: {summary[:100]}...")
+                            logger.debug("Extracted actual summary after reasoning: %.100s...", summary)
                             break
             
             # Validate length - be more lenient (up to 200 chars is OK)
             if summary and len(summary) <= 200 and len(summary) > 10:
-                duration = time.time() - start_time
-                logger.debug(f"Summary generated successfully in {duration:.2f}s (length: {len(summary)} chars)")
+                logger.debug("Summary generated successfully in %.2fs (length: %d chars)",
+                             time.time() - start_time, len(summary))
                 return summary
             else:
                 logger.warning(f"Summary still invalid (length: {len(summary) if summary else 0} chars), using fallback")
@@ -5,11 +5,102 @@ File: ui/chat_components.py
 Reusable components for chatbot interface
 """
 
+import html
+import re
 import streamlit as st
+from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
-from ui.components import display_movie_card
+from ui.components import build_movie_card_html
 from utils.genre_utils import get_genre_emoji
 
+# Patterns that indicate a new search request
+NEW_SEARCH_PATTERNS = (
+    'cari film lain',
+    'cari lagi',
+    'film lain',
+    'rekomendasi lain',
+    'yang lain',
+    'cari yang lain',
+    'cari film lainnya',
+    'film lainnya',
+    'rekomendasi lainnya',
+    'cari lagi film',
+    'cari film baru',
+    'film baru',
+    'rekomendasi baru',
+    'cari film yang lain',
+    'tolong cari',
+    'bisa cari',
+    'bisa cari film',
+    'cari film',
+    'cari film lain dong',
+    'cari film lain lagi'
+)
+
+# Confirmation keywords (matched as substrings, checked in this priority order)
+POSITIVE_KEYWORDS = ('ya', 'yup', 'yes', 'ok', 'oke', 'baik', 'silahkan', 'tampilkan', 'mau', 'ingin')
+CARI_CONFIRM_KEYWORDS = ('ya', 'ok', 'oke', 'baik', 'saja', 'sih')
+NEGATIVE_KEYWORDS = ('tidak', 'no', 'nope', 'skip', 'lewati', 'tidak mau', 'enggak')
+CHANGE_KEYWORDS = ('ubah', 'ganti', 'change', 'lain', 'beda', 'bisa', 'boleh')
+GENRE_KEYWORDS = ('action', 'comedy', 'drama', 'horror', 'romance', 'thriller', 'sci-fi', 'fantasy')
+
+def _keyword_alternation(keywords) -> str:
+    """
+    Build a regex that matches any keyword as a substring
+    
+    Keywords are folded into a prefix trie first, so shared prefixes
+    ('tidak'/'tidak mau', 'yup'/'yes') are walked once by the regex engine.
+    
+    Args:
+        keywords: Iterable of keyword strings
+    
+    Returns:
+        Regex source string
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[None] = True  # keyword ends here
+    return _trie_to_regex(trie)
+
+def _trie_to_regex(node: Dict[Any, Any]) -> str:
+    """Convert a keyword trie node to a regex fragment"""
+    # Only presence is checked, so a keyword makes any longer one sharing its prefix redundant
+    if None in node:
+        return ""
+    branches = [re.escape(char) + _trie_to_regex(child) for char, child in node.items()]
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
+
+# Compiled once at import; each check is a single C-level scan
+_NEW_SEARCH_RE = re.compile(_keyword_alternation(NEW_SEARCH_PATTERNS))
+_CARI_CONFIRM_RE = re.compile(_keyword_alternation(CARI_CONFIRM_KEYWORDS))
+
+# One scan reports every confirmation category present in the input. Groups are
+# listed in priority order inside a zero-width lookahead, so overlapping keywords
+# from different categories are all found and the higher-priority one wins.
+_CONFIRMATION_RE = re.compile("(?=" + "|".join(
+    f"(?P<{label}>{_keyword_alternation(keywords)})"
+    for label, keywords in (
+        ("yes", POSITIVE_KEYWORDS),
+        ("no", NEGATIVE_KEYWORDS),
+        ("change", CHANGE_KEYWORDS),
+        ("genre", GENRE_KEYWORDS),
+    )
+) + ")")
+
+# Tool icon mapping
+TOOL_ICONS = {
+    "Mood Analyzer": "🤔",
+    "Movie Search": "🔍",
+    "Review Summarizer": "📝",
+    "Preparing": "⚙️"
+}
+
 def render_chat_message(message: Dict[str, Any], show_timestamp: bool = False):
     """
     Render a chat message with better styling
@@ -29,24 +120,24 @@ def render_chat_message(message: Dict[str, Any], show_timestamp: bool = False):
         
         # Display timestamp if requested
         if show_timestamp and timestamp:
-            try:
-                from datetime import datetime
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                st.caption(f"🕐 {dt.strftime('%H:%M')}")
-            except:
-                pass
+            time_text = _format_timestamp(timestamp)
+            if time_text:
+                st.caption(f"🕐 {time_text}")
         
         # Display movie recommendations if present
         if metadata.get("type") == "recommendation":
             movies = metadata.get("movies", [])
             if movies:
                 st.markdown("---")
-                for idx, movie in enumerate(movies, 1):
-                    display_movie_card(movie, idx)
-                    if movie.get('review_summary'):
-                        st.markdown(f"**💬 Netizen:** {movie.get('review_summary')}")
-                    if idx < len(movies):
-                        st.markdown("---")
+                _render_movie_list(movies)
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(timestamp: str) -> str:
+    """Format an ISO timestamp as HH:MM (empty string if it can't be parsed)"""
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).strftime('%H:%M')
+    except ValueError:
+        return ""
 
 def render_movie_recommendation(movies: List[Dict[str, Any]], start_index: int = 1):
     """
@@ -62,14 +153,29 @@ def render_movie_recommendation(movies: List[Dict[str, Any]], start_index: int =
     
     st.markdown("### 🎬 Rekomendasi Film")
     
-    for idx, movie in enumerate(movies, start_index):
-        display_movie_card(movie, idx)
-        
+    _render_movie_list(movies, start_index)
+
+def _render_movie_list(movies: List[Dict[str, Any]], start_index: int = 1):
+    """
+    Render movie cards, each followed by review summary and separator
+    
+    All cards, review summaries and separators are sent as a single
+    HTML element instead of a column layout plus several markdown
+    elements per movie.
+    
+    Args:
+        movies: List of movie dictionaries
+        start_index: Starting index for numbering
+    """
+    last = len(movies) - 1
+    parts = []
+    for i, movie in enumerate(movies):
+        parts.append(build_movie_card_html(movie, start_index + i))
         if movie.get('review_summary'):
-            st.markdown(f"**💬 Netizen:** {movie.get('review_summary')}")
-        
-        if idx < len(movies) + start_index - 1:
-            st.markdown("---")
+            parts.append(f'<p class="movie-summary"><strong>💬 Netizen:</strong> {html.escape(movie["review_summary"])}</p>')
+        if i < last:
+            parts.append("<hr>")
+    st.markdown("\n".join(parts), unsafe_allow_html=True)
 
 def render_confirmation_prompt(genres: List[str], mood_summary: str = ""):
     """
@@ -80,7 +186,7 @@ def render_confirmation_prompt(genres: List[str], mood_summary: str = ""):
         mood_summary: Optional mood summary text
     """
     # Format genres with emojis
-    genre_text = ", ".join([f"{get_genre_emoji(g)} {g}" for g in genres])
+    genre_text = ", ".join(f"{get_genre_emoji(g)} {g}" for g in genres)
     
     confirmation_text = f"Berdasarkan mood Anda"
     if mood_summary:
@@ -173,39 +279,7 @@ def is_new_search_request(user_input: str) -> bool:
     Returns:
         True if user is requesting a new search, False otherwise
     """
-    user_lower = user_input.lower().strip()
-    
-    # Patterns that indicate a new search request
-    new_search_patterns = [
-        'cari film lain',
-        'cari lagi',
-        'film lain',
-        'rekomendasi lain',
-        'yang lain',
-        'cari yang lain',
-        'cari film lainnya',
-        'film lainnya',
-        'rekomendasi lainnya',
-        'cari lagi film',
-        'cari film baru',
-        'film baru',
-        'rekomendasi baru',
-        'cari film yang lain',
-        'tolong cari',
-        'bisa cari',
-        'bisa cari film',
-        'cari film',
-        'cari lagi film',
-        'cari film lain dong',
-        'cari film lain lagi'
-    ]
-    
-    # Check if input matches any new search pattern
-    for pattern in new_search_patterns:
-        if pattern in user_lower:
-            return True
-    
-    return False
+    return _NEW_SEARCH_RE.search(user_input.lower().strip()) is not None
 
 def parse_confirmation_response(user_input: str) -> Optional[str]:
     """
@@ -223,32 +297,27 @@ def parse_confirmation_response(user_input: str) -> Optional[str]:
     if is_new_search_request(user_input):
         return None
     
-    # Positive responses (removed 'cari' to avoid conflict with new search requests)
-    # Only accept 'cari' if it's clearly a confirmation like "ya, cari" or "cari saja"
-    positive_keywords = ['ya', 'yup', 'yes', 'ok', 'oke', 'baik', 'silahkan', 'tampilkan', 'mau', 'ingin']
-    if any(keyword in user_lower for keyword in positive_keywords):
-        return "yes"
+    # Classify keywords in a single pass; positive responses win immediately
+    # ('cari' is handled separately to avoid conflict with new search requests)
+    found = set()
+    for match in _CONFIRMATION_RE.finditer(user_lower):
+        if match.lastgroup == "yes":
+            return "yes"
+        found.add(match.lastgroup)
     
     # Special case: "cari" alone or with confirmation words
     if 'cari' in user_lower:
         # Only treat as "yes" if it's clearly a confirmation (short response)
-        if len(user_lower.split()) <= 3 and any(word in user_lower for word in ['ya', 'ok', 'oke', 'baik', 'saja', 'sih']):
+        if len(user_lower.split()) <= 3 and _CARI_CONFIRM_RE.search(user_lower):
             return "yes"
         # Otherwise, it's likely a new search request (handled by is_new_search_request above)
     
     # Negative responses
-    negative_keywords = ['tidak', 'no', 'nope', 'skip', 'lewati', 'tidak mau', 'enggak']
-    if any(keyword in user_lower for keyword in negative_keywords):
+    if "no" in found:
         return "no"
     
-    # Change request
-    change_keywords = ['ubah', 'ganti', 'change', 'lain', 'beda', 'bisa', 'boleh']
-    if any(keyword in user_lower for keyword in change_keywords):
-        return "change"
-    
-    # Check if user is requesting specific genre
-    genre_keywords = ['action', 'comedy', 'drama', 'horror', 'romance', 'thriller', 'sci-fi', 'fantasy']
-    if any(keyword in user_lower for keyword in genre_keywords):
+    # Change request, or user is requesting a specific genre
+    if found:
         return "change"
     
     return None
@@ -264,15 +333,7 @@ def render_tool_status(tool_name: str, is_active: bool = True) -> str:
     Returns:
         HTML string for tool status badge
     """
-    # Tool icon mapping
-    tool_icons = {
-        "Mood Analyzer": "🤔",
-        "Movie Search": "🔍",
-        "Review Summarizer": "📝",
-        "Preparing": "⚙️"
-    }
-    
-    icon = tool_icons.get(tool_name, "🔄")
+    icon = TOOL_ICONS.get(tool_name, "🔄")
     active_class = "active" if is_active else ""
     
     return f"""
@@ -291,15 +352,7 @@ def render_loading_with_status(tool_name: str, status_message: str, show_spinner
         status_message: Status message describing what's happening
         show_spinner: Whether to show spinner
     """
-    # Tool icon mapping
-    tool_icons = {
-        "Mood Analyzer": "🤔",
-        "Movie Search": "🔍",
-        "Review Summarizer": "📝",
-        "Preparing": "⚙️"
-    }
-    
-    icon = tool_icons.get(tool_name, "🔄")
+    icon = TOOL_ICONS.get(tool_name, "🔄")
     
     # Create loading container HTML
     loading_html = f"""
@@ -359,15 +412,7 @@ def render_loading_with_progress(tool_name: str, status_message: str, current: i
         current: Current item number (0 if not applicable)
         total: Total items (0 if not applicable)
     """
-    # Tool icon mapping
-    tool_icons = {
-        "Mood Analyzer": "🤔",
-        "Movie Search": "🔍",
-        "Review Summarizer": "📝",
-        "Preparing": "⚙️"
-    }
-    
-    icon = tool_icons.get(tool_name, "🔄")
+    icon = TOOL_ICONS.get(tool_name, "🔄")
     
     # Build status message with progress if applicable
     full_status = status_message
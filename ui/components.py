@@ -3,132 +3,206 @@ Reusable UI Components
 File: ui/components.py
 """
 
+import html
+import json
+import re
 import streamlit as st
-from typing import Dict, Any, List
-from utils.genre_utils import get_genre_emoji
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+from core.session_manager import SessionManager
+from utils.cache_utils import StreamlitCache
+from utils.genre_utils import get_genre_emoji, get_all_genre_names
 from ui.styles import get_rating_stars, get_mood_emoji
 
-def display_movie_card(movie: Dict[str, Any], index: int):
+# YouTube video ID from youtube.com/watch?v=, youtu.be/ and youtube.com/embed/ URLs
+_YOUTUBE_ID_RE = re.compile(r'(?:youtube\.com/(?:watch\?v=|embed/)|youtu\.be/)([A-Za-z0-9_-]{11})')
+
+# Placeholder shown when a movie has no poster
+_NO_POSTER_HTML = """
+            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                        border-radius: 10px; 
+                        padding: 40px; 
+                        text-align: center; 
+                        color: white;">
+                <p style="font-size: 2em;">🎬</p>
+                <p>No Poster Available</p>
+            </div>
+            """
+
+# Trailer link for non-YouTube or unrecognized trailer URLs
+_TRAILER_LINK_HTML = """
+                <div style="margin-top: 15px;">
+                    <h4>🎥 Trailer</h4>
+                    <p>
+                        <a href="{trailer_url}" target="_blank" style="color: #667eea; text-decoration: none;">
+                            🔗 Tonton Trailer
+                        </a>
+                    </p>
+                </div>
+                """
+
+def _format_genres(genres: Tuple[str, ...]) -> str:
+    """Format genres as emojis (first three) followed by comma-separated names"""
+    genre_emojis = [get_genre_emoji(g) for g in genres[:3]]
+    return " ".join(genre_emojis) + " " + ", ".join(genres)
+
+@st.cache_data(show_spinner=False, max_entries=512)
+def _build_card_html(
+    index: int,
+    title: str,
+    original_title: str,
+    tmdb_id: Any,
+    year: Any,
+    rating: float,
+    vote_count: int,
+    genres: Tuple[str, ...],
+    overview: str,
+    score: float,
+    poster_url: Optional[str],
+    trailer_url: Optional[str]
+) -> str:
     """
-    Display a movie card with all information including poster and trailer
+    Build movie card HTML: poster and info side by side (cached across reruns)
     
     Args:
-        movie: Movie dictionary
         index: Movie number in list
-    """
-    # Extract data
-    title = movie.get('title', 'Unknown')
-    original_title = movie.get('original_title', '')
-    tmdb_id = movie.get('tmdb_id')
-    year = movie.get('year', 'N/A')
-    rating = movie.get('rating', 0)
-    vote_count = movie.get('vote_count', 0)
-    genres = movie.get('genres', [])
-    overview = movie.get('overview', 'No description available')
-    score = movie.get('score', 0)
-    
-    # Extract poster and trailer from raw_payload (from Qdrant database)
-    raw_payload = movie.get('raw_payload', {})
-    poster_url = raw_payload.get('poster_url') or None
-    trailer_url = raw_payload.get('trailer_url') or None
-    
-    # Clean URLs (remove None or empty strings)
-    if poster_url and not isinstance(poster_url, str):
-        poster_url = None
-    if trailer_url and not isinstance(trailer_url, str):
-        trailer_url = None
+        title, original_title, tmdb_id, year, rating, vote_count,
+        genres, overview, score: Movie fields (genres as tuple for hashing)
+        poster_url: Poster URL or None
+        trailer_url: Trailer URL or None
     
-    # Get genre emojis
-    genre_emojis = [get_genre_emoji(g) for g in genres[:3]]
-    genre_text = " ".join(genre_emojis) + " " + ", ".join(genres)
+    Returns:
+        Card HTML as a single line (safe to concatenate into one markdown block)
+    """
+    # Escape every field placed in text or attribute position: all cards of a
+    # list share one markdown block, so one stray quote or tag would break the rest
+    # (payload fields may be None, NaN or numbers such as a title of 1917)
+    title = html.escape(str(title or ''), quote=True)
+    original_title = html.escape(str(original_title or ''), quote=True)
+    year = html.escape(str(year), quote=True)
+    genre_text = html.escape(_format_genres(genres), quote=True)
+    overview = str(overview or '')
+    overview_text = html.escape(overview[:250], quote=True) + ('...' if len(overview) > 250 else '')
     
     # Get rating stars
     stars = get_rating_stars(rating)
     
-    # Create layout with columns for poster and info
-    col1, col2 = st.columns([1, 2])
+    # Create card HTML with all fields from database
+    title_display = f"🎬 {index}. {title}"
+    if original_title and original_title != title:
+        title_display += f" <em>({original_title})</em>"
+    title_display += f" ({year})"
     
-    with col1:
-        # Display poster if available
-        if poster_url:
-            st.image(poster_url, use_container_width=True, caption=title)
-        else:
-            # Placeholder if no poster
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                        border-radius: 10px; 
-                        padding: 40px; 
-                        text-align: center; 
-                        color: white;">
-                <p style="font-size: 2em;">🎬</p>
-                <p>No Poster Available</p>
-            </div>
-            """, unsafe_allow_html=True)
+    tmdb_info = ""
+    if tmdb_id:
+        tmdb_info = f"<p><strong>🆔 TMDB ID:</strong> {html.escape(str(tmdb_id), quote=True)}</p>"
     
-    with col2:
-        # Create card HTML with all fields from database
-        title_display = f"🎬 {index}. {title}"
-        if original_title and original_title != title:
-            title_display += f" <em>({original_title})</em>"
-        title_display += f" ({year})"
-        
-        tmdb_info = ""
-        if tmdb_id:
-            tmdb_info = f"<p><strong>🆔 TMDB ID:</strong> {tmdb_id}</p>"
-        
-        st.markdown(f"""
+    card_html = f"""
         <div class="movie-card">
             <h3>{title_display}</h3>
             {tmdb_info}
             <p><strong>⭐ Rating:</strong> {rating}/10 {stars} ({vote_count:,} votes)</p>
             <p><strong>🎭 Genre:</strong> {genre_text}</p>
             <p><strong>📊 Match Score:</strong> {score}/10</p>
-            <p><strong>📝 Synopsis:</strong> {overview[:250]}{'...' if len(overview) > 250 else ''}</p>
+            <p><strong>📝 Synopsis:</strong> {overview_text}</p>
         </div>
-        """, unsafe_allow_html=True)
+        """
+    
+    # Build trailer HTML if available
+    trailer_html = ""
+    if trailer_url:
+        # Extract YouTube video ID from watch/short/embed URL formats
+        match = _YOUTUBE_ID_RE.search(trailer_url)
+        video_id = match.group(1) if match else None
+        trailer_href = html.escape(trailer_url, quote=True)
         
-        # Display trailer if available
-        if trailer_url:
-            video_id = None
-            
-            # Extract YouTube video ID from various URL formats
-            if 'youtube.com/watch?v=' in trailer_url:
-                video_id = trailer_url.split('watch?v=')[1].split('&')[0]
-            elif 'youtu.be/' in trailer_url:
-                video_id = trailer_url.split('youtu.be/')[1].split('?')[0]
-            elif 'youtube.com/embed/' in trailer_url:
-                video_id = trailer_url.split('embed/')[1].split('?')[0]
-            
-            if video_id:
-                # Embed YouTube video
-                st.markdown(f"""
+        if video_id:
+            # YouTube thumbnail linking to the video (no player loaded until clicked)
+            trailer_html = f"""
                 <div style="margin-top: 15px;">
                     <h4>🎥 Trailer</h4>
-                    <iframe width="100%" height="315" 
-                            src="https://www.youtube.com/embed/{video_id}" 
-                            frameborder="0" 
-                            allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture" 
-                            allowfullscreen>
-                    </iframe>
+                    <a href="{trailer_href}" target="_blank" class="trailer-thumb">
+                        <img src="https://img.youtube.com/vi/{video_id}/hqdefault.jpg" 
+                             loading="lazy" 
+                             alt="Trailer {title}">
+                        <div class="play-btn">▶</div>
+                    </a>
                     <p style="margin-top: 5px;">
-                        <a href="{trailer_url}" target="_blank" style="color: #667eea; text-decoration: none;">
+                        <a href="{trailer_href}" target="_blank" style="color: #667eea; text-decoration: none;">
                             🔗 Tonton di YouTube
                         </a>
                     </p>
                 </div>
-                """, unsafe_allow_html=True)
-            else:
-                # Just show link if not YouTube or unrecognized format
-                st.markdown(f"""
-                <div style="margin-top: 15px;">
-                    <h4>🎥 Trailer</h4>
-                    <p>
-                        <a href="{trailer_url}" target="_blank" style="color: #667eea; text-decoration: none;">
-                            🔗 Tonton Trailer
-                        </a>
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
+                """
+        else:
+            # Just show link if not YouTube or unrecognized format
+            trailer_html = _TRAILER_LINK_HTML.format(trailer_url=trailer_href)
+    
+    # Poster (or placeholder) in the left column, info in the right one
+    if poster_url:
+        poster_html = f"""
+            <img class="movie-poster" loading="lazy" decoding="async" src="{html.escape(poster_url, quote=True)}" alt="{title}">
+            <p class="movie-poster-caption">{title}</p>
+            """
+    else:
+        poster_html = _NO_POSTER_HTML
+    
+    row_html = f"""
+        <div class="movie-row">
+            <div class="movie-poster-col">{poster_html}</div>
+            <div class="movie-info-col">{card_html}{trailer_html}</div>
+        </div>
+        """
+    
+    # Collapse to one line: blank or indented lines would end the markdown HTML block
+    return " ".join(line.strip() for line in row_html.splitlines() if line.strip())
+
+def build_movie_card_html(movie: Dict[str, Any], index: int) -> str:
+    """
+    Build HTML for a movie card including poster and trailer
+    
+    Args:
+        movie: Movie dictionary
+        index: Movie number in list
+    
+    Returns:
+        Card HTML (render with unsafe_allow_html=True)
+    """
+    # Extract poster and trailer from raw_payload (from Qdrant database)
+    raw_payload = movie.get('raw_payload', {})
+    poster_url = raw_payload.get('poster_url') or None
+    trailer_url = raw_payload.get('trailer_url') or None
+    
+    # Clean URLs (remove None or empty strings)
+    if poster_url and not isinstance(poster_url, str):
+        poster_url = None
+    if trailer_url and not isinstance(trailer_url, str):
+        trailer_url = None
+    
+    return _build_card_html(
+        index,
+        movie.get('title', 'Unknown'),
+        movie.get('original_title', ''),
+        movie.get('tmdb_id'),
+        movie.get('year', 'N/A'),
+        movie.get('rating', 0),
+        movie.get('vote_count', 0),
+        tuple(movie.get('genres', [])),
+        movie.get('overview', 'No description available'),
+        movie.get('score', 0),
+        poster_url,
+        trailer_url
+    )
+
+def display_movie_card(movie: Dict[str, Any], index: int):
+    """
+    Display a movie card with all information including poster and trailer
+    
+    Args:
+        movie: Movie dictionary
+        index: Movie number in list
+    """
+    st.markdown(build_movie_card_html(movie, index), unsafe_allow_html=True)
 
 def display_mood_analysis(mood_data: Dict[str, Any]):
     """
@@ -152,7 +226,8 @@ def display_mood_analysis(mood_data: Dict[str, Any]):
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.metric("Mood", ", ".join(moods)[:20] + "..." if len(", ".join(moods)) > 20 else ", ".join(moods))
+        mood_text = ", ".join(moods)
+        st.metric("Mood", mood_text[:20] + "..." if len(mood_text) > 20 else mood_text)
     
     with col2:
         st.metric("Intensity", f"{intensity}%")
@@ -206,7 +281,6 @@ def display_preferences_editor():
     """Display genre preferences editor"""
     st.markdown("### ⚙️ Preferences")
     
-    from utils.genre_utils import get_all_genre_names
     all_genres = get_all_genre_names()
     
     # Get current preferences
@@ -231,7 +305,6 @@ def display_preferences_editor():
     
     # Update button
     if st.button("💾 Save Preferences", use_container_width=True):
-        from core.session_manager import SessionManager
         SessionManager.update_preferences(liked=liked, disliked=disliked)
         st.success("✅ Preferences saved!")
         st.rerun()
@@ -245,14 +318,12 @@ def display_sidebar_actions():
     
     with col1:
         if st.button("🗑️ Clear Chat", use_container_width=True, key="clear_chat"):
-            from core.session_manager import SessionManager
             SessionManager.clear_chat()
             st.success("Chat cleared!")
             st.rerun()
     
     with col2:
         if st.button("🔄 Reset Profile", use_container_width=True, key="reset_profile"):
-            from core.session_manager import SessionManager
             SessionManager.reset_profile()
             st.success("Profile reset!")
             st.rerun()
@@ -263,10 +334,6 @@ def display_export_button():
     st.markdown("### 📥 Export")
     
     if st.button("📄 Export Conversation", use_container_width=True):
-        from core.session_manager import SessionManager
-        import json
-        from datetime import datetime
-        
         data = SessionManager.export_data()
         
         st.download_button(
@@ -279,8 +346,6 @@ def display_export_button():
 
 def display_cache_stats():
     """Display cache statistics"""
-    from utils.cache_utils import StreamlitCache
-    
     stats = StreamlitCache.get_stats()
     
     with st.expander("📊 Cache Statistics"):
@@ -3,14 +3,9 @@ UI Styles and CSS
 File: ui/styles.py
 """
 
-def get_custom_css() -> str:
-    """
-    Get custom CSS for Streamlit app
-    
-    Returns:
-        CSS string
-    """
-    return """
+import re
+
+_CUSTOM_CSS_RAW = """
     <style>
         /* ===== Main Theme - Netflix Red ===== */
         .main {
@@ -90,6 +85,44 @@ def get_custom_css() -> str:
             font-weight: 600;
         }
         
+        /* ===== Movie List Grid (poster | info) ===== */
+        .movie-row {
+            display: grid;
+            grid-template-columns: 1fr 2fr;
+            gap: 20px;
+            align-items: start;
+        }
+        
+        .movie-row .movie-card {
+            margin-top: 0;
+        }
+        
+        .movie-poster {
+            width: 100%;
+            max-width: 100%;
+            height: auto;
+            border-radius: 10px;
+            box-shadow: 0 4px 15px rgba(0, 0, 0, 0.3);
+            transition: transform 0.3s ease;
+        }
+        
+        .movie-poster:hover {
+            transform: scale(1.05);
+        }
+        
+        .movie-poster-caption {
+            text-align: center;
+            font-size: 0.85em;
+            color: rgba(255, 255, 255, 0.6);
+            margin-top: 5px;
+        }
+        
+        @media (max-width: 640px) {
+            .movie-row {
+                grid-template-columns: 1fr;
+            }
+        }
+        
         /* ===== Movie Poster ===== */
         .stImage img {
             border-radius: 10px;
@@ -107,6 +140,42 @@ def get_custom_css() -> str:
             box-shadow: 0 4px 15px rgba(0, 0, 0, 0.3);
         }
         
+        /* ===== Trailer Thumbnail ===== */
+        .trailer-thumb {
+            position: relative;
+            display: block;
+            border-radius: 10px;
+            overflow: hidden;
+            box-shadow: 0 4px 15px rgba(0, 0, 0, 0.3);
+        }
+        
+        .trailer-thumb img {
+            display: block;
+            width: 100%;
+        }
+        
+        .trailer-thumb .play-btn {
+            position: absolute;
+            top: 50%;
+            left: 50%;
+            transform: translate(-50%, -50%);
+            width: 68px;
+            height: 48px;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            background: rgba(229, 9, 20, 0.85);
+            border-radius: 12px;
+            color: white;
+            font-size: 1.5em;
+            transition: all 0.3s ease;
+        }
+        
+        .trailer-thumb:hover .play-btn {
+            background: #E50914;
+            transform: translate(-50%, -50%) scale(1.1);
+        }
+        
         /* ===== Metric Cards - Netflix Red ===== */
         .metric-card {
             background: linear-gradient(135deg, rgba(229, 9, 20, 0.3) 0%, rgba(178, 7, 16, 0.3) 100%);
@@ -447,6 +516,40 @@ def get_custom_css() -> str:
     </style>
     """
 
+def _minify_css(css: str) -> str:
+    """
+    Strip comments and redundant whitespace from CSS
+    
+    Args:
+        css: CSS source (may include the surrounding <style> tag)
+    
+    Returns:
+        Minified CSS string
+    """
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    css = re.sub(r':\s+', ':', css)
+    return css.replace(';}', '}').strip()
+
+# Minified once at import; this is what gets sent to the browser
+_CUSTOM_CSS = _minify_css(_CUSTOM_CSS_RAW)
+
+def get_custom_css() -> str:
+    """
+    Get custom CSS for Streamlit app
+    
+    Returns:
+        CSS string
+    """
+    return _CUSTOM_CSS
+
+_MOOD_EMOJI = {
+    "positive": "😊",
+    "neutral": "😐",
+    "negative": "😔"
+}
+
 def get_mood_emoji(emotion_type: str) -> str:
     """
     Get emoji for emotion type
@@ -457,12 +560,14 @@ def get_mood_emoji(emotion_type: str) -> str:
     Returns:
         Emoji string
     """
-    emoji_map = {
-        "positive": "😊",
-        "neutral": "😐",
-        "negative": "😔"
-    }
-    return emoji_map.get(emotion_type, "😐")
+    return _MOOD_EMOJI.get(emotion_type, "😐")
+
+# Star string per integer rating 0-10 (<5: 1 star, then one more per point up to 8+)
+_RATING_STARS = (
+    "⭐", "⭐", "⭐", "⭐", "⭐",
+    "⭐⭐", "⭐⭐⭐", "⭐⭐⭐⭐",
+    "⭐⭐⭐⭐⭐", "⭐⭐⭐⭐⭐", "⭐⭐⭐⭐⭐"
+)
 
 def get_rating_stars(rating: float) -> str:
     """
@@ -474,13 +579,4 @@ def get_rating_stars(rating: float) -> str:
     Returns:
         Star emoji string
     """
-    if rating >= 8:
-        return "⭐⭐⭐⭐⭐"
-    elif rating >= 7:
-        return "⭐⭐⭐⭐"
-    elif rating >= 6:
-        return "⭐⭐⭐"
-    elif rating >= 5:
-        return "⭐⭐"
-    else:
-        return "⭐"
\ No newline at end of file
+    return _RATING_STARS[max(0, min(10, int(rating)))]
\ No newline at end of file
@@ -4,29 +4,116 @@ File: utils/cache_utils.py
 """
 
 import streamlit as st
+import functools
 import hashlib
-import json
-from typing import Any, Optional, Dict
-from datetime import datetime, timedelta
+import heapq
+import itertools
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Dict, Hashable, List, Set, Tuple
 import logging
+from config.settings import AppConfig
 
 logger = logging.getLogger(__name__)
 
+# session_state slots holding the cache, kept apart from widget state
+_STORE_KEY = "_cache_store"
+_PREFIX_INDEX_KEY = "_cache_by_prefix"
+_EXPIRY_HEAP_KEY = "_cache_expiry_heap"
+
+# Tie-breaker for heap items so keys themselves are never compared
+_heap_seq = itertools.count()
+
 class StreamlitCache:
     """
     Simple cache wrapper for Streamlit session state
     Better than @st.cache_data for dynamic session-based caching
     """
     
+    # Per-session entry cap; least recently used entries are evicted past it
+    MAX_ENTRIES: int = AppConfig.MAX_CACHE_ENTRIES
+    
     @staticmethod
-    def _get_cache_key(prefix: str, *args, **kwargs) -> str:
-        """Generate cache key from arguments"""
-        key_data = json.dumps({
-            "prefix": prefix,
-            "args": args,
-            "kwargs": kwargs
-        }, sort_keys=True, default=str)
-        return f"cache_{hashlib.md5(key_data.encode()).hexdigest()}"
+    def _get_cache_key(prefix: str, *args, **kwargs) -> Hashable:
+        """
+        Generate cache key from arguments
+        
+        Hashable arguments (strings, numbers, tuples) are used as-is in a
+        tuple key; anything else falls back to a BLAKE2b digest of its repr.
+        
+        Like lru_cache(typed=True), the tuple key carries the type of each
+        top-level argument, so f(1), f(True) and f(1.0) don't share an entry
+        (equal values nested inside tuples still do). Trade-off: the key
+        keeps the argument objects themselves alive in session_state, so
+        callers should pass short keys (e.g. a content hash) rather than
+        large blobs.
+        """
+        kw_items = tuple(sorted(kwargs.items())) if kwargs else ()
+        key = (
+            prefix,
+            args,
+            kw_items,
+            tuple(type(v) for v in args),
+            tuple(type(v) for _, v in kw_items)
+        )
+        try:
+            hash(key)
+            return key
+        except TypeError:
+            pass
+        
+        # repr never fails on odd types, unlike json.dumps without default=;
+        # type tags are dropped here since repr already tells 1, 1.0 and True apart
+        return hashlib.blake2b(repr(key[:3]).encode(), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _store() -> "OrderedDict[Hashable, Dict[str, Any]]":
+        """Get the session's cache entries in LRU order (created on first use)"""
+        return st.session_state.setdefault(_STORE_KEY, OrderedDict())
+    
+    @staticmethod
+    def _prefix_index() -> Dict[str, Set[Hashable]]:
+        """Get the prefix -> cache keys index (created on first use)"""
+        return st.session_state.setdefault(_PREFIX_INDEX_KEY, {})
+    
+    @staticmethod
+    def _expiry_heap() -> List[Tuple[float, int, Hashable]]:
+        """Get the (expires_at, seq, key) min-heap used for eviction (created on first use)"""
+        return st.session_state.setdefault(_EXPIRY_HEAP_KEY, [])
+    
+    @staticmethod
+    def _unindex(cache_key: Hashable, entry: Dict[str, Any]):
+        """Remove an evicted entry's key from its prefix bucket"""
+        bucket = StreamlitCache._prefix_index().get(entry['prefix'])
+        if bucket is not None:
+            bucket.discard(cache_key)
+    
+    @staticmethod
+    def _evict_expired(store: Dict[Hashable, Dict[str, Any]], now: float) -> int:
+        """
+        Drop expired entries, oldest expiry first
+        
+        Heap items left behind by a re-set key are skipped, since the
+        stored entry then carries a later expiry.
+        
+        Args:
+            store: Cache entry dict
+            now: Current time.monotonic() value
+        
+        Returns:
+            Number of entries evicted
+        """
+        heap = StreamlitCache._expiry_heap()
+        evicted = 0
+        while heap and heap[0][0] < now:
+            _, _, key = heapq.heappop(heap)
+            entry = store.get(key)
+            if entry is not None and entry['expires_at'] < now:
+                del store[key]
+                StreamlitCache._unindex(key, entry)
+                evicted += 1
+        return evicted
     
     @staticmethod
     def get(prefix: str, *args, **kwargs) -> Optional[Any]:
@@ -41,29 +128,35 @@ class StreamlitCache:
             Cached value or None if not found/expired
         """
         cache_key = StreamlitCache._get_cache_key(prefix, *args, **kwargs)
-        logger.debug(f"Cache GET - Key: {cache_key[:50]}...")
+        return StreamlitCache._get_by_key(prefix, cache_key)
+    
+    @staticmethod
+    def _get_by_key(prefix: str, cache_key: Hashable) -> Optional[Any]:
+        """Get cached value for an already-built cache key"""
+        logger.debug("Cache GET - Key: %.50s...", cache_key)
         
-        if cache_key in st.session_state:
-            cached_data = st.session_state[cache_key]
-            
-            # Check if expired
-            if 'expires_at' in cached_data:
-                now = datetime.now()
-                expires_at = cached_data['expires_at']
-                if now > expires_at:
-                    # Expired, remove from cache
-                    del st.session_state[cache_key]
-                    age = (now - cached_data.get('created_at', now)).total_seconds()
-                    logger.debug(f"Cache expired: {cache_key} (age: {age:.0f}s)")
-                    return None
-                else:
-                    remaining = (expires_at - now).total_seconds()
-                    logger.debug(f"Cache hit: {cache_key} (TTL remaining: {remaining:.0f}s)")
+        store = StreamlitCache._store()
+        cached_data = store.get(cache_key)
+        
+        if cached_data is not None:
+            now = time.monotonic()
+            expires_at = cached_data['expires_at']
+            if now > expires_at:
+                # Expired, remove from cache
+                del store[cache_key]
+                StreamlitCache._unindex(cache_key, cached_data)
+                if logger.isEnabledFor(logging.DEBUG):
+                    age = now - cached_data['created_at']
+                    logger.debug("Cache expired: %s (age: %.0fs)", cache_key, age)
+                return None
             
-            logger.debug(f"Cache hit: {cache_key}")
+            store.move_to_end(cache_key)
+            if logger.isEnabledFor(logging.DEBUG):
+                remaining = expires_at - now
+                logger.debug("Cache hit: %s (TTL remaining: %.0fs)", cache_key, remaining)
             return cached_data['value']
         
-        logger.debug(f"Cache miss: {cache_key}")
+        logger.debug("Cache miss: %s", cache_key)
         return None
     
     @staticmethod
@@ -84,74 +177,85 @@ class StreamlitCache:
             *args, **kwargs: Cache key components
         """
         cache_key = StreamlitCache._get_cache_key(prefix, *args, **kwargs)
+        StreamlitCache._set_by_key(prefix, cache_key, value, ttl_seconds)
+    
+    @staticmethod
+    def _set_by_key(prefix: str, cache_key: Hashable, value: Any, ttl_seconds: int):
+        """Set cached value for an already-built cache key"""
+        store = StreamlitCache._store()
+        now = time.monotonic()
+        expires_at = now + ttl_seconds
         
-        try:
-            value_size = len(str(value))
-        except:
-            value_size = 0
+        # Sweep expired entries on write so never-read entries don't pile up
+        evicted = StreamlitCache._evict_expired(store, now)
+        if evicted:
+            logger.debug("Cache evicted %d expired entries", evicted)
         
-        st.session_state[cache_key] = {
+        store[cache_key] = {
             'value': value,
-            'created_at': datetime.now(),
-            'expires_at': datetime.now() + timedelta(seconds=ttl_seconds)
+            'prefix': prefix,
+            'created_at': now,
+            'expires_at': expires_at
         }
+        store.move_to_end(cache_key)
+        while len(store) > StreamlitCache.MAX_ENTRIES:
+            lru_key, lru_entry = store.popitem(last=False)
+            StreamlitCache._unindex(lru_key, lru_entry)
+            logger.debug("Cache evicted LRU entry: %s", lru_key)
+        heap = StreamlitCache._expiry_heap()
+        heapq.heappush(heap, (expires_at, next(_heap_seq), cache_key))
+        
+        # Items for LRU-evicted, cleared or re-set keys linger until their TTL;
+        # rebuild from live entries so the heap stays bounded by the store
+        if len(heap) > 2 * len(store):
+            heap[:] = [(entry['expires_at'], next(_heap_seq), key) for key, entry in store.items()]
+            heapq.heapify(heap)
+        StreamlitCache._prefix_index().setdefault(prefix, set()).add(cache_key)
         
-        logger.debug(f"Cache SET - Key: {cache_key[:50]}..., TTL: {ttl_seconds}s, Size: ~{value_size} chars")
+        logger.debug("Cache SET - Key: %.50s..., TTL: %ss", cache_key, ttl_seconds)
     
     @staticmethod
     def clear_prefix(prefix: str):
         """Clear all cache entries with given prefix"""
-        keys_to_delete = [
-            key for key in st.session_state.keys() 
-            if key.startswith(f"cache_") and prefix in key
-        ]
+        store = StreamlitCache._store()
+        keys_to_delete = StreamlitCache._prefix_index().pop(prefix, set())
         
         for key in keys_to_delete:
-            del st.session_state[key]
+            store.pop(key, None)
         
         logger.info(f"Cleared {len(keys_to_delete)} cache entries with prefix: {prefix}")
     
     @staticmethod
     def clear_all():
         """Clear all cache entries"""
-        cache_keys = [
-            key for key in st.session_state.keys() 
-            if key.startswith("cache_")
-        ]
+        store = StreamlitCache._store()
+        count = len(store)
         
-        for key in cache_keys:
-            del st.session_state[key]
+        store.clear()
+        StreamlitCache._prefix_index().clear()
+        StreamlitCache._expiry_heap().clear()
         
-        logger.info(f"Cleared all cache: {len(cache_keys)} entries")
+        logger.info(f"Cleared all cache: {count} entries")
     
     @staticmethod
     def get_stats() -> Dict[str, Any]:
         """Get cache statistics"""
-        cache_keys = [
-            key for key in st.session_state.keys() 
-            if key.startswith("cache_")
-        ]
+        store = StreamlitCache._store()
         
         total_size = 0
         expired_count = 0
-        now = datetime.now()
+        now = time.monotonic()
         
-        for key in cache_keys:
-            cached_data = st.session_state[key]
-            
-            # Rough size estimation
-            try:
-                total_size += len(str(cached_data['value']))
-            except:
-                pass
+        for cached_data in store.values():
+            # Rough size estimation (shallow, avoids rendering the value)
+            total_size += sys.getsizeof(cached_data['value'])
             
             # Check if expired
-            if 'expires_at' in cached_data:
-                if now > cached_data['expires_at']:
-                    expired_count += 1
+            if now > cached_data['expires_at']:
+                expired_count += 1
         
         return {
-            'total_entries': len(cache_keys),
+            'total_entries': len(store),
             'expired_entries': expired_count,
             'estimated_size_bytes': total_size,
             'estimated_size_kb': round(total_size / 1024, 2)
@@ -169,9 +273,13 @@ def cache_result(ttl_seconds: int = 3600, prefix: str = "default"):
             return results
     """
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            # Build the key once for both lookup and store
+            cache_key = StreamlitCache._get_cache_key(prefix, func.__name__, *args, **kwargs)
+            
             # Try to get from cache
-            cached = StreamlitCache.get(prefix, func.__name__, *args, **kwargs)
+            cached = StreamlitCache._get_by_key(prefix, cache_key)
             if cached is not None:
                 return cached
             
@@ -179,14 +287,7 @@ def cache_result(ttl_seconds: int = 3600, prefix: str = "default"):
             result = func(*args, **kwargs)
             
             # Store in cache
-            StreamlitCache.set(
-                prefix, 
-                result, 
-                ttl_seconds, 
-                func.__name__, 
-                *args, 
-                **kwargs
-            )
+            StreamlitCache._set_by_key(prefix, cache_key, result, ttl_seconds)
             
             return result
         
@@ -3,8 +3,7 @@ Genre Utilities
 File: utils/genre_utils.py
 """
 
-from typing import List, Tuple
-from functools import lru_cache
+from typing import Iterable, List, Tuple
 
 # TMDB Genre ID Mapping
 GENRE_MAP = {
@@ -32,50 +31,75 @@ GENRE_MAP = {
 # Reverse mapping (ID to name)
 GENRE_ID_TO_NAME = {v: k for k, v in GENRE_MAP.items()}
 
-@lru_cache(maxsize=128)
-def genre_names_to_ids(names: Tuple[str, ...]) -> List[int]:
+# Display names (title-cased once instead of per lookup)
+GENRE_ID_TO_TITLE = {k: v.title() for k, v in GENRE_ID_TO_NAME.items()}
+_UNKNOWN = "Unknown"
+
+# Sorted display names for pickers
+_ALL_GENRE_NAMES = tuple(sorted({name.title() for name in GENRE_MAP}))
+
+# Emoji per genre (lowercase name)
+_GENRE_EMOJI = {
+    "action": "💥",
+    "adventure": "🗺️",
+    "animation": "🎨",
+    "comedy": "😂",
+    "crime": "🔫",
+    "documentary": "📹",
+    "drama": "🎭",
+    "family": "👨‍👩‍👧‍👦",
+    "fantasy": "🧙",
+    "history": "📜",
+    "horror": "👻",
+    "music": "🎵",
+    "mystery": "🔍",
+    "romance": "❤️",
+    "science fiction": "🚀",
+    "sci-fi": "🚀",
+    "thriller": "😱",
+    "war": "⚔️",
+    "western": "🤠"
+}
+
+def genre_names_to_ids(names: Iterable[str]) -> List[int]:
     """
     Convert genre names to IDs
     
     Args:
-        names: Tuple of genre names (tuple for caching)
+        names: Genre names
     
     Returns:
         List of genre IDs
     
     Example:
-        >>> genre_names_to_ids(("Action", "Comedy"))
+        >>> genre_names_to_ids(["Action", "Comedy"])
         [28, 35]
     """
     return [
-        GENRE_MAP.get(name.lower()) 
-        for name in names 
-        if GENRE_MAP.get(name.lower())
+        gid
+        for name in names
+        if (gid := GENRE_MAP.get(name.lower())) is not None
     ]
 
-@lru_cache(maxsize=128)
-def genre_ids_to_names(ids: Tuple[int, ...]) -> List[str]:
+def genre_ids_to_names(ids: Iterable[int]) -> List[str]:
     """
     Convert genre IDs to names
     
     Args:
-        ids: Tuple of genre IDs (tuple for caching)
+        ids: Genre IDs
     
     Returns:
         List of genre names (capitalized)
     
     Example:
-        >>> genre_ids_to_names((28, 35))
+        >>> genre_ids_to_names([28, 35])
         ['Action', 'Comedy']
     """
-    return [
-        GENRE_ID_TO_NAME.get(id, "unknown").title() 
-        for id in ids
-    ]
+    return [GENRE_ID_TO_TITLE.get(id, _UNKNOWN) for id in ids]
 
-def get_all_genre_names() -> List[str]:
-    """Get all available genre names"""
-    return sorted([name.title() for name in set(GENRE_MAP.keys())])
+def get_all_genre_names() -> Tuple[str, ...]:
+    """Get all available genre names (shared, immutable)"""
+    return _ALL_GENRE_NAMES
 
 def get_genre_id(name: str) -> int:
     """
@@ -95,25 +119,4 @@ def is_valid_genre(name: str) -> bool:
 
 def get_genre_emoji(name: str) -> str:
     """Get emoji for genre"""
-    emoji_map = {
-        "action": "💥",
-        "adventure": "🗺️",
-        "animation": "🎨",
-        "comedy": "😂",
-        "crime": "🔫",
-        "documentary": "📹",
-        "drama": "🎭",
-        "family": "👨‍👩‍👧‍👦",
-        "fantasy": "🧙",
-        "history": "📜",
-        "horror": "👻",
-        "music": "🎵",
-        "mystery": "🔍",
-        "romance": "❤️",
-        "science fiction": "🚀",
-        "sci-fi": "🚀",
-        "thriller": "😱",
-        "war": "⚔️",
-        "western": "🤠"
-    }
-    return emoji_map.get(name.lower(), "🎬")
\ No newline at end of file
+    return _GENRE_EMOJI.get(name.lower(), "🎬")
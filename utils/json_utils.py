@@ -0,0 +1,31 @@
+"""
+JSON Utilities
+File: utils/json_utils.py
+"""
+
+import json
+from typing import Any, Union
+
+# Use orjson (Rust, much faster) when installed, stdlib json otherwise
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text using the fastest available parser
+    
+    Args:
+        data: JSON document as str or bytes
+    
+    Returns:
+        Parsed Python object
+    
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's error subclasses it)
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)